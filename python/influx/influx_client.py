@@ -85,9 +85,9 @@ class InfluxClient:
         try:
             self.__user: str = auth_influx["username"]
             self.__password: str = auth_influx["password"]
-            self.__use_ssl: bool = auth_influx["ssl"]
+            self.__use_ssl: bool = SppUtils.parse_bool(auth_influx["ssl"])
             if(self.__use_ssl):
-                self.__verify_ssl: bool = auth_influx["verify_ssl"]
+                self.__verify_ssl: bool = SppUtils.parse_bool(auth_influx["verify_ssl"])
             else:
                 self.__verify_ssl = False
             self.__port: int = auth_influx["srv_port"]
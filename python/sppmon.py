@@ -347,7 +347,9 @@ class SppMon:
         try:
             try:
                 file = open(self.pid_file_path, "rt")
-                match_list = re.findall(r"(\d+) " + str(OPTIONS), file.read())
+                # escape the options defensively, paths within them contain regex chars like dots
+                pid_pattern = re.compile(r"(\d+) " + re.escape(str(OPTIONS)))
+                match_list = pid_pattern.findall(file.read())
                 file.close()
                 deleted_processes: List[str] = []
                 for match in match_list:
@@ -359,7 +361,8 @@ class SppMon:
                         else:
                             args = ['ps', '-p', match]
                         result = subprocess.run(args, check=True, capture_output=True)
-                        if(re.search(match, str(result.stdout))):
+                        # plain substring, no regex required
+                        if(match in str(result.stdout)):
                             return False
                         # not in there -> delete entry
                         deleted_processes.append(match)
@@ -375,9 +378,7 @@ class SppMon:
                     for pid in deleted_processes:
                         file_str = file_str.replace(f"{pid} {options}", "")
                     # do not delete if empty since we will use it below
-                    file = open(self.pid_file_path, "wt")
-                    file.write(file_str.strip())
-                    file.close()
+                    self.__replace_pid_file(file_str.strip())
 
             except FileNotFoundError:
                 pass # no file created yet
@@ -400,12 +401,29 @@ class SppMon:
             if(not new_file_str.strip()):
                 os.remove(self.pid_file_path)
             else:
-                file = open(self.pid_file_path, "wt")
-                file.write(new_file_str)
-                file.close()
+                self.__replace_pid_file(new_file_str)
         except Exception as error:
             ExceptionUtils.exception_info(error, "Error when removing pid_file")
 
+    def __replace_pid_file(self, file_str: str) -> None:
+        """Replaces the content of the pid file atomically.
+
+        Writes into a temporary file first, so other instances never read a truncated pid file.
+
+        Arguments:
+            file_str {str} -- new content of the pid file
+        """
+        tmp_file_path = f"{self.pid_file_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_file_path, "wt") as file:
+                file.write(file_str)
+            os.replace(tmp_file_path, self.pid_file_path)
+        except Exception:
+            # do not leave the temporary file behind
+            if(os.path.exists(tmp_file_path)):
+                os.remove(tmp_file_path)
+            raise
+
 
     def set_critial_configs(self, config_file: Dict[str, Any]) -> None:
         """Sets up any critical infrastructure, to be called within the init.
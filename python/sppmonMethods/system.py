@@ -7,7 +7,7 @@ Classes:
 import logging
 
 import re
-from typing import Union, Optional, Dict, Any
+from typing import Pattern, Union, Optional, Dict, Any
 
 from utils.execption_utils import ExceptionUtils
 from utils.methods_utils import MethodUtils
@@ -28,6 +28,9 @@ class SystemMethods:
 
     """
 
+    __site_id_pattern: Pattern[str] = re.compile(r"\d+")
+    """numeric site id, use with `fullmatch`."""
+
     def __init__(self, influx_client: Optional[InfluxClient], api_queries: Optional[ApiQueries], verbose: bool = False):
         if(not influx_client):
             raise ValueError("System Methods are not available, missing influx_client.")
@@ -97,7 +100,8 @@ class SystemMethods:
         # if string, parse to int
         if(isinstance(site_id, str)):
             site_id = site_id.strip(" ")
-            if(re.match(r"\d+", site_id)):
+            # the whole id needs to be numeric, a prefix match would fail within int()
+            if(self.__site_id_pattern.fullmatch(site_id)):
                 site_id = int(site_id)
             else:
                 ExceptionUtils.error_message("siteId is of unsupported string format")
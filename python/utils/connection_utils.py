@@ -5,7 +5,7 @@ Classes:
     ConnectionUtils
 """
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import urllib.parse as parse
 
 from utils.spp_utils import SppUtils
@@ -57,32 +57,39 @@ class ConnectionUtils:
 
         # all results should be in here
         full_dict: Dict[str, Any] = {}
+        cls.__walk_sub_values(mydict, ignore_list, full_dict)
 
+        return full_dict
+
+    @classmethod
+    def __walk_sub_values(cls, mydict: Dict[str, Any], ignore_list: List[str],
+                          full_dict: Dict[str, Any], prefix: Optional[str] = None) -> None:
+        """Recursive worker of `get_with_sub_values`, inserts all values directly into `full_dict`.
+
+        Arguments:
+            mydict {Dict[str, Any]} -- dict to be walked through
+            ignore_list {List[str]} -- which qualified paths should be deleted/ignored.
+            full_dict {Dict[str, Any]} -- result dict, gets extended in place
+
+        Keyword Arguments:
+            prefix {Optional[str]} -- qualified name of `mydict` within the original dict, None on top level (default: {None})
+        """
         for (key, value) in mydict.items():
+            # first qualify names to allow filtering in recursive calls
+            # otherwise only simply names below
+            # an empty key is a valid prefix, only the top level is unqualified
+            qualified_key = key if prefix is None else f"{prefix}.{key}"
+
             # ignore if this value / path should be ignored
             # effective deleting it.
-            if(key in ignore_list):
+            if(qualified_key in ignore_list):
                 continue
 
             # if a subdict, dig deeper
             if(isinstance(value, dict)):
-
-                # first qualify names to allow filtering in recursive calls
-                # otherwise only simply names below
-                sub_dict: Dict[str, Any] = {}
-                value: Dict[str, Any]
-                for (sub_key, sub_value) in value.items():
-                    qualified_key = "%s.%s" % (key, sub_key)
-                    sub_dict[qualified_key] = sub_value
-
-                sub_dict = cls.get_with_sub_values(sub_dict, ignore_list)
-
-                # Like a extend in this case
-                full_dict.update(sub_dict)
+                cls.__walk_sub_values(value, ignore_list, full_dict, qualified_key)
             else:
-                full_dict[key] = value
-
-        return full_dict
+                full_dict[qualified_key] = value
 
     @staticmethod
     def url_set_param(url: str, param_name: str = None, param_value: Any = None) -> str:
@@ -159,11 +166,27 @@ class ConnectionUtils:
         if(not param_name):
             raise ValueError("need a param_name to read a value")
 
-        _, _, _, _, query, _ = parse.urlparse(url)
-        query_params = parse.parse_qs(query)
+        # only the query part is of interest, avoid parsing the full url and all params
+        # strip the fragment first, it may contain a `?` itself
+        (url, _, _) = url.partition('#')
+        (_, separator, query) = url.partition('?')
+        if(not separator):
+            return None
+
+        # search for param_name in query. if exists, return all values like `parse_qs`. otherwiese none
+        values: List[str] = []
+        for param in query.split('&'):
+            (name, _, value) = param.partition('=')
+            # `parse_qs` ignores blank values
+            if(not value):
+                continue
+            # `parse_qs` unquotes the names too, only required if they contain quoted chars
+            if('%' in name or '+' in name):
+                name = parse.unquote_plus(name)
+            if(name == param_name):
+                values.append(parse.unquote_plus(value))
 
-        # search for param_name in list. if exists, return the value. otherwiese none
-        return query_params.get(param_name, None)
+        return values or None
 
     @classmethod
     def adjust_page_size(cls,
@@ -210,33 +233,34 @@ class ConnectionUtils:
                 LOGGER.info(f"reducing pagesize due timeout, from {page_size} to {new_page_size}.")
             return new_page_size
 
+        # steady state: send time is within the allowed delta, nothing to do
+        # compare by multiplication, no division required
+        if(preferred_time * (1 - cls.allowed_send_delta) <= send_time <= preferred_time * (1 + cls.allowed_send_delta)):
+            return page_size
+
         time_difference_quota = send_time / preferred_time
 
-        if(abs(time_difference_quota-1) > cls.allowed_send_delta):
-            LOGGER.debug(f"adjusting page size due too high time difference, actual: {send_time}, preferred: {preferred_time}")
-            if(cls.verbose):
-                LOGGER.info(f"adjusting page size due too high time difference, actual: {send_time}, preferred: {preferred_time}")
+        LOGGER.debug(f"adjusting page size due too high time difference, actual: {send_time}, preferred: {preferred_time}")
+        if(cls.verbose):
+            LOGGER.info(f"adjusting page size due too high time difference, actual: {send_time}, preferred: {preferred_time}")
 
-            # reset to the preferred value
-            new_page_size = page_size / time_difference_quota
-            new_page_size = int(new_page_size)
+        # reset to the preferred value
+        new_page_size = page_size / time_difference_quota
+        new_page_size = int(new_page_size)
 
-            # limit the maximum grow, with bonus for very low areas
-            if(new_page_size > cls.max_scaling_factor * (page_size + 5)):
-                new_page_size = int(cls.max_scaling_factor * (page_size + 5))
+        # limit the maximum grow, with bonus for very low areas
+        if(new_page_size > cls.max_scaling_factor * (page_size + 5)):
+            new_page_size = int(cls.max_scaling_factor * (page_size + 5))
 
-            # avoid getting stuck on 1
-            if(new_page_size < min_page_size + 5):
-                new_page_size = min_page_size + 5
+        # avoid getting stuck on 1
+        if(new_page_size < min_page_size + 5):
+            new_page_size = min_page_size + 5
 
-            LOGGER.debug(f"changed page size from {page_size} to {new_page_size}")
-            if(cls.verbose):
-                LOGGER.info(f"changed page size from {page_size} to {new_page_size}")
-
-            return new_page_size
+        LOGGER.debug(f"changed page size from {page_size} to {new_page_size}")
+        if(cls.verbose):
+            LOGGER.info(f"changed page size from {page_size} to {new_page_size}")
 
-        # nothing to do
-        return page_size
+        return new_page_size
 
     @classmethod
     def filter_values_dict(cls,
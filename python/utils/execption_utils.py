@@ -4,7 +4,6 @@ Classes:
     ExceptionUtils
 """
 import logging
-import sys
 import os
 
 from typing import List
@@ -49,17 +48,16 @@ class ExceptionUtils:
         Keyword Arguments:
             extra_message {str} -- Extra message to be saved and displayed (default: {None})
         """
-        error_type, error_2, trace_back = sys.exc_info()
+        # the error carries its own traceback, no need to query the interpreter state
+        error_type = type(error)
+        trace_back = error.__traceback__
         if(trace_back):
-            file_name = os.path.split(trace_back.tb_frame.f_code.co_filename)[1]
+            file_name = os.path.basename(trace_back.tb_frame.f_code.co_filename)
             line_number = trace_back.tb_lineno
         else:
             file_name = "unable to resolve traceback"
             line_number = -1
 
-        if(error != error_2):
-            LOGGER.error("two different error messages somehow, be aware some data migth be corrupt")
-
         cls.stored_errors.extend(error.args) # save error message
 
         LOGGER.error(f"Exception in FILE: {file_name}, Line: {line_number}, Exception: {error_type}")
@@ -6,7 +6,8 @@ Classes:
 """
 import re
 import logging
-from typing import Dict, Tuple, Union, Any, List
+from functools import lru_cache
+from typing import Dict, Pattern, Tuple, Union, Any, List, Optional
 
 from utils.spp_utils import SppUtils
 from utils.execption_utils import ExceptionUtils
@@ -29,6 +30,15 @@ class InfluxUtils:
     time_key_names: List[str] = ['time', SppUtils.capture_time_key, "logTime"]
     """default time_key names."""
 
+    __time_literal_pattern: Pattern[str] = re.compile(r"^(\d+(?:[uµsmhdw]|(?:ns)|(?:ms)))+$")
+    """any influxdb time literal, like `1h30m`."""
+    __transform_literal_pattern: Pattern[str] = re.compile(r"^(\d+(?:[smhdw]))+$")
+    """time literal with units of at least seconds, like `1h30m`."""
+    __literal_part_pattern: Pattern[str] = re.compile(r"((\d+)([a-z]+))")
+    """single value/unit part of a time literal, like `30m`."""
+    __field_chars_pattern: Pattern[str] = re.compile(r"[\s\[\]\{\}\"]")
+    """chars which mark a value as field in `default_split`."""
+
     @staticmethod
     def check_time_literal(value: str) -> bool:
         """Checks wheather the str is consistend as influxdb time literal
@@ -47,7 +57,7 @@ class InfluxUtils:
             raise ValueError("need value to verify time literal")
         if(not isinstance(value, str)):
             raise ValueError("type of the value for time literal check is not str")
-        if(re.match(r"^(\d+(?:[uµsmhdw]|(?:ns)|(?:ms)))+$", value)):
+        if(InfluxUtils.__time_literal_pattern.match(value)):
             return True
         return False
 
@@ -73,12 +83,12 @@ class InfluxUtils:
             raise ValueError("need a value to verify the time literal")
         if(not isinstance(value, str)):
             raise ValueError("type of the value for time literal transform is not str")
-        if(not re.match(r"^(\d+(?:[smhdw]))+$", value)):
+        if(not InfluxUtils.__transform_literal_pattern.match(value)):
             if(value.lower() == "inf"):
                 return "0s"
             raise ValueError("value does not pass the time literal check", value)
 
-        match_list = re.findall(r"((\d+)([a-z]+))", value)
+        match_list = InfluxUtils.__literal_part_pattern.findall(value)
         time_s = 0
         for (_, numbers, unit) in match_list: # full is first, but unused
             time_s += SppUtils.parse_unit(numbers, unit)
@@ -118,12 +128,63 @@ class InfluxUtils:
         # make sure the string is a string
         value = '{}'.format(value)
 
+        trans_table = InfluxUtils.__translation_table(tuple(replace_list))
+        if(trans_table is not None):
+            # single left-to-right scan: escape pairs are copied verbatim,
+            # everything in between is translated at once.
+            parts: List[str] = []
+            start = 0
+            index = value.find('\\')
+            while(index != -1):
+                parts.append(value[start:index].translate(trans_table))
+                parts.append(value[index:index+2])
+                start = index + 2
+                index = value.find('\\', start)
+            parts.append(value[start:].translate(trans_table))
+            return ''.join(parts)
+
+        # fallback for complex replacements, one regex pass each
         for(old, new) in replace_list:
             pattern = re.compile(r'((?<!\\{1})(?:\\{2})*)' + old)
             value = re.sub(pattern, r'\1'+new, value)
 
         return value
 
+    __regex_special_chars: str = r".^$*+?{}[]\|()"
+    """chars which would be interpreted by the regex engine of `escape_chars`."""
+    __group_reference_pattern: Pattern[str] = re.compile(r"\\(?:\d|g<)")
+    """group reference within a replacement, like `\\1` or `\\g<1>`."""
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def __translation_table(replace_tuple: Tuple[Tuple[str, str], ...]) -> Optional[Dict[int, str]]:
+        """Computes a `str.translate` table equal to the regex substitution of `escape_chars` outside of escape pairs.
+
+        Only possible if every old value is a single literal char and no replacement
+        could be matched again by one of the following replacements.
+
+        Args:
+            replace_tuple (Tuple[Tuple[str, str], ...]): the replace list as hashable tuple
+
+        Returns:
+            Optional[Dict[int, str]]: translation table or None if the regex path is required.
+        """
+        trans_table: Dict[int, str] = {}
+        for (index, (old, new)) in enumerate(replace_tuple):
+            if(len(old) != 1 or old in InfluxUtils.__regex_special_chars):
+                return None
+            # group references depend on the preceding escape signs, only the regex path can resolve them
+            if(InfluxUtils.__group_reference_pattern.search(new)):
+                return None
+            # expand the remaining escapes of the replacement like the regex path does
+            replacement = re.sub(r'()' + old, r'\1'+new, old)
+            if(replacement.endswith('\\') or
+               any(later_old in replacement for (later_old, _) in replace_tuple[index+1:])):
+                return None
+            # the first replacement wins, later ones would not find the char anymore
+            trans_table.setdefault(ord(old), replacement)
+        return trans_table
+
     @classmethod
     def default_split(cls, mydict: Dict[str, Any]) -> Tuple[
             Dict[str, str], Dict[str, Union[float, int, bool, str]], Union[str, int, None]]:
@@ -176,7 +237,7 @@ class InfluxUtils:
             if(not isinstance(value, str)):
                 value = '\"{}\"'.format(value)
 
-            if(re.search(r"[\s\[\]\{\}\"]", value)):
+            if(cls.__field_chars_pattern.search(value)):
                 fields[key] = value
             else:
                 tags[key] = value
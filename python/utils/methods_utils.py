@@ -8,8 +8,9 @@ import logging
 import json
 import re
 
+from itertools import chain
 from pprint import pprint
-from typing import Callable, List, Match, Tuple, Dict, Any, Union, Set
+from typing import Callable, List, Match, Pattern, Tuple, Dict, Any, Union
 from prettytable import PrettyTable
 from sppConnection.ssh_client import SshClient, SshCommand, SshTypes
 
@@ -137,11 +138,16 @@ class MethodUtils:
         if(not elem_list):
             ExceptionUtils.error_message(f">> No {name} are found")
 
-        if(rename_tuples):
+        # renaming a key to itself is useless, skip those once instead of per elem
+        rename_tuples = [(old_name, new_name) for (old_name, new_name) in rename_tuples if old_name != new_name]
+        if(rename_tuples and elem_list):
             for elem in elem_list:
                 # rename fields to make it more informative.
                 for(old_name, new_name) in rename_tuples:
-                    elem[new_name] = elem.pop(old_name)
+                    value = elem.pop(old_name, SppUtils.missing)
+                    # skip missing keys instead of aborting the whole query
+                    if(value is not SppUtils.missing):
+                        elem[new_name] = value
 
         if(cls.verbose and not deactivate_verbose):
             MethodUtils.my_print(elem_list)
@@ -162,14 +168,10 @@ class MethodUtils:
             pprint(data)
             return
 
-        # get all possible distinct keys,
-        row_keys_unorderd: Set[str] = set()
-        for row in data:
-            row_keys_unorderd.update(row.keys())
+        # get all possible distinct keys, ordered by first occurrence
+        row_keys: List[str] = list(dict.fromkeys(chain.from_iterable(row.keys() for row in data)))
 
         # make sure every row has all keys, fill with None
-        # cast to list to have one order
-        row_keys = list(row_keys_unorderd)
         row_val_list: List[List[Any]] = []
         for row in data:
             row_vals: List[Any] = []
@@ -186,18 +188,21 @@ class MethodUtils:
         print(table, flush=True) # type: ignore
 
     @staticmethod
-    def joblogs_parse_params(regex_str: str, parse_string: str, mapping_func: Callable[[Match[Any]], Dict[str, Any]]) -> Dict[str, Any]:
+    def joblogs_parse_params(regex: Union[str, Pattern[str]], parse_string: str, mapping_func: Callable[[Match[Any]], Dict[str, Any]]) -> Dict[str, Any]:
         """Used to parse a string within a joblog to stat transition. Note: match[0] is full match, group 1 is match[1] in lambda.
 
         Args:
-            regex_str (str): raw regex string used as pattern
+            regex (Union[str, Pattern[str]]): raw regex string or precompiled pattern, prefer the pattern on repeated calls
             parse_string (str): string to be matched
             mapping_func (Callable[[Match[Any]], Dict[str, Any]]): lambda which takes a match object and returns a dict.
 
         Returns:
             Dict[str, Any]: [description]
         """
-        match = re.match(regex_str, parse_string)
+        if(isinstance(regex, str)):
+            match = re.match(regex, parse_string)
+        else:
+            match = regex.match(parse_string)
         if(not match):
             return {}
-        return mapping_func(match)
\ No newline at end of file
+        return mapping_func(match)
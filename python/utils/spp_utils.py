@@ -10,10 +10,11 @@ import time
 import re
 import os
 
+from functools import lru_cache
 from pathlib import Path
 
 from numbers import Number
-from typing import Any, Optional, Tuple, Dict, Union, List
+from typing import Any, Optional, Pattern, Tuple, Dict, Union, List
 
 from utils.execption_utils import ExceptionUtils
 
@@ -25,10 +26,12 @@ class SppUtils:
     Attributes:
         verbose - to be set in sppmon.
         capture_time_key - name of the unique capture time stamp.
+        missing - sentinel for absent dict keys.
 
     Methods:
         read_file - Reads parameters from the JSON file and returns a JSON dict.
         get_cfg_params - Wrapper method to check if the arguments of the config file are correct.
+        parse_bool - Parses a config value into a bool, accepting strings like "false".
         get_actual_time_sec - returns the actual time as timestamp in seconds.
         get_capture_timestamp_sec - Returns Tuple of the capturetimestamp name and value.
         epoch_time_to_seconds - Converts timestamp from any epoch-format into epoch-seconds.
@@ -44,8 +47,14 @@ class SppUtils:
     capture_time_key: str = "sppmonCaptureTimestampS"
     """name of the single timestamp capture to allow same naming within the db"""
 
-    @staticmethod
-    def filename_of_config(conf_file_path: str, fileending: str) -> str:
+    missing: object = object()
+    """sentinel for absent dict keys, allows `None` as regular value."""
+
+    __logs_dir_path: Optional[str] = None
+    """path to the home / sppmonLogs dir, created on first use"""
+
+    @classmethod
+    def filename_of_config(cls, conf_file_path: str, fileending: str) -> str:
         """returns a filepath to the home / sppmonLogs out of the config file + a new fileending
 
         Args:
@@ -57,21 +66,21 @@ class SppUtils:
         """
         if(conf_file_path):
             real_path = os.path.realpath(conf_file_path)
-            # get everything behind the last slash
-            config_name = os.path.basename(real_path)
-            # get name without fileending
-            config_name = config_name.split('.')[-2]
+            # get name without path and fileending
+            (config_name, _) = os.path.splitext(os.path.basename(real_path))
 
             pid_file_name = config_name + fileending
         else:
             pid_file_name = "no_config_file" + fileending
 
-        home_path = Path.home()
-        pid_file_dir_path = os.path.join(home_path, "sppmonLogs")
-        # create if not existent
-        Path(pid_file_dir_path).mkdir(parents=True, exist_ok=True)
+        # the dir does not change while running, only resolve and create it once
+        if(cls.__logs_dir_path is None):
+            logs_dir_path = os.path.join(Path.home(), "sppmonLogs")
+            # create if not existent
+            os.makedirs(logs_dir_path, exist_ok=True)
+            cls.__logs_dir_path = logs_dir_path
 
-        return os.path.join(pid_file_dir_path, pid_file_name)
+        return os.path.join(cls.__logs_dir_path, pid_file_name)
 
     @classmethod
     def read_conf_file(cls, config_file_path: str) -> Dict[str, Any]:
@@ -142,10 +151,27 @@ class SppUtils:
 
         return cfg
 
+    @staticmethod
+    def parse_bool(value: Union[bool, str]) -> bool:
+        """Parses a config value into a bool, accepting strings like "false".
+
+        A plain `bool("False")` would be true, so strings are compared instead.
+
+        Arguments:
+            value {Union[bool, str]} -- bool or string representation of a bool
+
+        Returns:
+            bool -- true only for true bools or the string "true", ignoring case.
+        """
+        if(isinstance(value, str)):
+            return value.strip().lower() == "true"
+        return bool(value)
+
     @staticmethod
     def get_actual_time_sec() -> int:
         """returns the actual time as timestamp in seconds."""
-        return int(round(time.time()))
+        # integer arithmetic, rounded to the nearest second
+        return (time.time_ns() + 500_000_000) // 1_000_000_000
 
     @classmethod
     def get_capture_timestamp_sec(cls) -> Tuple[str, int]:
@@ -153,6 +179,9 @@ class SppUtils:
         return cls.capture_time_key, cls.get_actual_time_sec()
 
 
+    __timestamp_pattern: Pattern[str] = re.compile(r"(-?\d+)(\.\d+)?")
+    """integer or float timestamp, group 2 is only set for floats."""
+
     @staticmethod
     def to_epoch_secs(time_stamp: Union[str, int, float]) -> int:
         """Converts timestamp from any epoch-format into epoch-seconds precision.
@@ -166,23 +195,39 @@ class SppUtils:
         Returns:
             int -- epoch timestamp in second format
         """
-        if(isinstance(time_stamp, str)):
-            time_stamp = time_stamp.strip(" ")
-            if(re.match(r"\d+", time_stamp)):
-                time_stamp = int(time_stamp)
-            elif(re.match(r"\d+\.\d+", time_stamp)):
-                time_stamp = float(time_stamp)
-        if(not isinstance(time_stamp, (int, float))):
+        time_type = type(time_stamp)
+        if(time_type is str):
+            time_stamp = time_stamp.strip()
+            # single match decides between int and float, rejects anything else
+            number_match = SppUtils.__timestamp_pattern.fullmatch(time_stamp)
+            if(not number_match):
+                raise ValueError("unsupported timestamp type", time_stamp)
+            if(number_match.group(2)):
+                (time_stamp, time_type) = (float(time_stamp), float)
+            else:
+                (time_stamp, time_type) = (int(time_stamp), int)
+        # exact type check first, isinstance only for subclasses
+        elif(time_type is not int and time_type is not float and not isinstance(time_stamp, (int, float))):
             raise ValueError("unsupported timestamp type")
 
         # convert ms or ns to seconds
-        # that is the limit to ms format
-        while(time_stamp >= 99999999999):
-            time_stamp /= 1000
+        # that is the limit to ms format, scale up the limit instead of dividing each step
+        scale = 1
+        while(time_stamp >= 99999999999 * scale):
+            scale *= 1000
 
-        return int(time_stamp)
+        # integer division is exact, avoid float rounding on ns timestamps
+        if(time_type is int):
+            return time_stamp // scale
+        return int(time_stamp / scale)
 
 
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def __split_key_name(key_name: str) -> Tuple[str, ...]:
+        """Splits a dotted key path into its levels, cached since the same paths are used for every record."""
+        return tuple(key_name.split('.'))
+
     @staticmethod
     def get_nested_kv(key_name: str, nested_dict: Dict[str, Any]) -> Tuple[str, Optional[Any]]:
         """Aquire a nested key-value pair from a dict with possible sub-dicts.
@@ -207,7 +252,7 @@ class SppUtils:
             raise ValueError("need dictonary to find elem within it")
 
         # split into multiple sub-levels
-        key_list = key_name.split('.')
+        key_list = SppUtils.__split_key_name(key_name)
 
         sub_dict: Union[Any, Dict[str, Any]] = nested_dict
 
@@ -215,14 +260,14 @@ class SppUtils:
         # at least one key available due arg check above
         for key in key_list:
 
-            # path is available -> go on
-            if(sub_dict):
-
-                # sub_dict is now either another sub_dict or the result
-                sub_dict = sub_dict.get(key, None)
+            # sub_dict is now either another sub_dict or the result
+            if(isinstance(sub_dict, dict)):
+                sub_dict = sub_dict.get(key, SppUtils.missing)
+            else:
+                sub_dict = SppUtils.missing
 
             # path is wrong or not existent
-            else:
+            if(sub_dict is SppUtils.missing):
                 # return wanted key and None
                 return (key_list[-1], None)
 
@@ -230,47 +275,55 @@ class SppUtils:
         return (key_list[-1], sub_dict)
 
 
-    __display_datatype = 1 # Bytes are displayed as bytes
     __datatypes: Dict[str, int] = {
         'no type':          1,
 
         # DATA
-        # assumed its byte, not bit
-        'b':                pow(2, 0) / __display_datatype,
+        # assumed its byte, not bit, bytes are displayed as bytes
+        'b':                1,
 
-        'k':                pow(2, 10) / __display_datatype,
-        'kb':               pow(10, 3) / __display_datatype,
-        'kib':              pow(2, 10) / __display_datatype,
+        'k':                1 << 10,
+        'kb':               1_000,
+        'kib':              1 << 10,
 
-        #'m':               pow(2, 20) / __display_datatype, NOTE: Duplicate key, unused anyway
-        'mb':               pow(10, 6) / __display_datatype,
-        'mib':              pow(2, 20) / __display_datatype,
+        #'m':               1 << 20, NOTE: Duplicate key, unused anyway
+        'mb':               1_000_000,
+        'mib':              1 << 20,
 
-        'g':                pow(2, 30) / __display_datatype,
-        'gb':               pow(10, 9) / __display_datatype,
-        'gib':              pow(2, 30) / __display_datatype,
+        'g':                1 << 30,
+        'gb':               1_000_000_000,
+        'gib':              1 << 30,
 
-        't':                pow(2, 40) / __display_datatype,
-        'tb':               pow(10, 12) / __display_datatype,
-        'tib':              pow(2, 40) / __display_datatype,
+        't':                1 << 40,
+        'tb':               1_000_000_000_000,
+        'tib':              1 << 40,
 
         # TIME
 
-        'second(s)':        pow(60, 0),
-        'second':           pow(60, 0),
-        's':                pow(60, 0),
+        'second(s)':        1,
+        'second':           1,
+        's':                1,
 
-        'min(s)':           pow(60, 1),
-        'm':                pow(60, 1),
+        'min(s)':           60,
+        'm':                60,
 
-        'hour(s)':          pow(60, 2),
-        'h':                pow(60, 2),
+        'hour(s)':          3_600,
+        'h':                3_600,
 
-        'd':                pow(60, 2) * 24,
+        'd':                86_400,
 
-        'w':                pow(60, 2) * 24 * 7
+        'w':                604_800
     }
 
+    __value_unit_pattern: Pattern[str] = re.compile(r"(-?\d+(?:\.\d+)?)([a-zA-Z]+)")
+    """value directly followed by its unit, like `10GB`."""
+    __unit_pattern: Pattern[str] = re.compile(r"(\D+)")
+    """unit without value, like `GB`."""
+    __int_pattern: Pattern[str] = re.compile(r"^-?\d+$")
+    """integer value, like `-10`."""
+    __float_pattern: Pattern[str] = re.compile(r"^-?\d+\.\d+$")
+    """float value, like `-10.5`."""
+
     @classmethod
     def parse_unit(
             cls, data: Union[str, Number], given_unit: str = None,
@@ -302,7 +355,9 @@ class SppUtils:
 
         if(not data):
             return None
-        if(isinstance(data, Number)):
+        # exact type checks first, the abstract Number check is only required for other numeric types
+        data_type = type(data)
+        if(data_type is int or data_type is float or (data_type is not str and isinstance(data, Number))):
             return data
 
         if(not isinstance(data, str)):
@@ -312,42 +367,64 @@ class SppUtils:
         if(delimiter is None):
             raise ValueError("delimteter cannot be None")
 
-        data_parts = list(map(lambda part: part.strip(" "), data.split(delimiter)))
+        # bind once, used for every part
+        datatypes = cls.__datatypes
+
+        # fast path for the common case of a single value with a separately given unit
+        if(given_unit):
+            value = data.strip(" ")
+            multiplier = datatypes.get(given_unit.lower(), None)
+            if(multiplier is not None and delimiter and delimiter not in value):
+                if(cls.__int_pattern.match(value)):
+                    return int(value) * multiplier
+                if(cls.__float_pattern.match(value)):
+                    return round(float(value) * multiplier)
+
+        # skip empty parts caused by repeated delimiters
+        data_parts = [part.strip(" ") for part in data.split(delimiter) if part.strip(" ")]
+        if(not data_parts):
+            return None
 
-        i: int = 0
+        # stays an int unless a float value is given
         final_value: Union[int, float] = 0
 
-        while(i < len(data_parts)):
-            value = data_parts[i]
-            i += 1
+        # iterate with a single part lookahead, which is consumed if it is a unit
+        parts_iter = iter(data_parts)
+        next_part: Optional[str] = next(parts_iter, None)
+        while(next_part is not None):
+            value = next_part
+            next_part = next(parts_iter, None)
             unit = 'no type'
 
             # get correct value and unit
             if(given_unit):
                 unit = given_unit
             else:
-                unit_match = re.match(r"(-?\d+(?:\.\d+)?)([a-zA-Z]+)", value)
+                unit_match = cls.__value_unit_pattern.match(value)
                 if(unit_match):
-                    value = unit_match.group(1)
-                    if(unit_match.group(2)):
-                        unit = unit_match.group(2)
-                elif(i < len(data_parts)):
-                    unit_match = re.match(r"(\D+)", data_parts[i])
+                    # group 2 is never empty on a match
+                    (value, unit) = unit_match.group(1, 2)
+                elif(next_part is not None):
+                    unit_match = cls.__unit_pattern.match(next_part)
                     if(unit_match and unit_match.group(1)):
                         unit = unit_match.group(1)
-                        i += 1
+                        next_part = next(parts_iter, None)
 
-            if(unit.lower() not in cls.__datatypes):
+            multiplier = datatypes.get(unit.lower(), None)
+            if(multiplier is None):
                 raise ValueError("no known datatype for value with given unit", value, unit, data_parts)
 
             # convert value
-            if(re.match(r"^-?\d+$", value)):
+            if(cls.__int_pattern.match(value)):
                 value = int(value)
-            elif(re.match(r"^-?\d+\.\d+$", value)):
+            elif(cls.__float_pattern.match(value)):
                 value = float(value)
             else:
                 raise ValueError("value is not numeric", value)
 
-            final_value += value * cls.__datatypes[unit.lower()]
+            final_value += value * multiplier
 
+        # all multipliers are ints, only float values need rounding
+        if(isinstance(final_value, int)):
+            return final_value
         return round(final_value)